@@ -8,34 +8,51 @@ Features
 - Generates N unique 6-digit serial numbers (no leading zeros stripped).
 - Attaches a role, celebrity name, and item description.
 - Deterministic runs via --seed (or AUTHENTICON_SEED env var).
-- Validates uniqueness and serial format.
-- Writes JSON or CSV. Also usable as a library.
+- Optional multi-process generation via --workers for large counts.
+- Validates uniqueness and serial format (--skip-validate or python -O to skip).
+- Writes JSON, CSV or Parquet (Parquet needs pyarrow). Also usable as a library.
 
 CLI
   python authenticon_seed.py --count 250 --out data.json --format json --seed 42
   python authenticon_seed.py --count 200 --out data.csv  --format csv
+  python authenticon_seed.py --count 200 --out data.parquet --format parquet
 
 Library
-  from authenticon_seed import generate_dataset
+  from authenticon_seed import generate_columns, generate_dataset, iter_dataset
   records = generate_dataset(count=300, seed=123)
+  for row in iter_dataset(count=300, seed=123): ...   # streaming tuples in FIELDS order
+  columns = generate_columns(count=300, seed=123)   # {"serial_number": [...], ...}
 """
 from __future__ import annotations
 import argparse
 import csv
+import io
 import json
 import os
 import random
 import re
-from dataclasses import dataclass, asdict
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Iterable, List, Set
+from itertools import chain, islice, repeat
+from math import floor
+from string import Formatter
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Sequence, Tuple
 
 SERIAL_RE = re.compile(r"^\d{6}$")
+SERIAL_MIN = 100000
+SERIAL_MAX = 999999
+SERIAL_SPACE = SERIAL_MAX - SERIAL_MIN + 1
+CURRENT_YEAR = datetime.now().year
+_SOURCE = sys.intern("seed-generator v1")
 
 # --- Domain model ------------------------------------------------------------
 
-@dataclass(frozen=True)
-class AuthRecord:
+# A NamedTuple rather than a dataclass: no per-instance __dict__ (88 bytes per
+# record), and iter_dataset() rows are the same tuples, so records can be built
+# on demand with AuthRecord._make only where the named view is wanted.
+class AuthRecord(NamedTuple):
     serial_number: str          # 6 digits, zero-padded if needed
     role: str                   # e.g., "Athlete", "Singer", "Actor", ...
     celebrity: str              # e.g., "LeBron James"
@@ -43,6 +60,10 @@ class AuthRecord:
     year: int                   # provenance hint
     source: str                 # "seed-generator v1"
 
+# Column order shared by AuthRecord, iter_dataset() rows and the writers
+FIELDS = AuthRecord._fields
+Row = Tuple[str, str, str, str, int, str]
+
 # --- Catalogs (tweak/extend freely) -----------------------------------------
 
 ROLES = [
@@ -222,6 +243,28 @@ ITEM_TEMPLATES = {
     ],
 }
 
+# Lightweight vocab pools, keyed by the template placeholder they fill
+VOCAB = {
+    "album": ["1989", "Lemonade", "21", "After Hours", "Take Care", "Folklore", "Scorpion", "Starboy", "Sour", "UTOPIA"],
+    "tour": ["Eras", "Formation", "Monsters of Pop", "World Tour", "Summer Stadiums", "Neon Nights", "Happier Than Ever"],
+    "event": ["Wimbledon Final", "NBA Finals", "Super Bowl", "World Cup Final", "US Open", "Champions League Final"],
+    "film": ["Oppenheimer", "Dune", "Barbie", "Titanic", "The Matrix", "Pulp Fiction", "Avengers: Endgame", "John Wick"],
+    "prop": ["helmet", "shield", "gauntlet", "ring", "badge", "watch"],
+    "venue": ["Madison Square Garden", "The Forum", "O2 Arena", "Comedy Cellar", "Laugh Factory"],
+    "special": ["Paper Tiger", "Tamborine", "Sticks & Stones", "Baby Cobra", "Homecoming"],
+    "series": ["Challenge Series", "24 Hours", "Tech Reviews", "Creator Games", "Daily Vlog"],
+    "platform": ["YouTube", "Twitch", "TikTok", "Instagram"],
+    "book": ["The Long Night", "Ocean of Stars", "Electric Dreams", "Paper Hearts", "Hidden Doors"],
+    "festival": ["Coachella", "Ultra", "Tomorrowland", "EDC", "Lollapalooza"],
+    "club": ["Ministry of Sound", "Fabric", "Pacha", "Berghain", "Output"],
+    "org": ["T1", "G2 Esports", "Fnatic", "Team Liquid", "Cloud9"],
+    "team": ["Chicago Bulls", "Los Angeles Lakers", "New England Patriots", "Golden State Warriors", "New York Yankees"],
+}
+
+# Role-specific event pools
+ATHLETE_EVENTS = ["NBA Finals", "Super Bowl", "World Series", "Wimbledon Final", "US Open"]
+ESPORTS_EVENTS = ["Worlds", "IEM Katowice", "The International", "Valorant Masters", "ESL One"]
+
 SPORT_BY_ATHLETE = {
     "LeBron James": ("basketball", "Cleveland Cavaliers"),
     "Michael Jordan": ("basketball", "Chicago Bulls"),
@@ -245,139 +288,309 @@ SPORT_BY_ATHLETE = {
     "Megan Rapinoe": ("soccer", "USA"),
 }
 
+# Flattened (role, celeb) pool as parallel columns, built once at import.
+# Interned, so every record shares one object per distinct role/celeb/source.
+_POOL_ROLES = tuple(sys.intern(role) for role, names in CELEBS.items() for _ in names)
+_POOL_CELEBS = tuple(sys.intern(name) for names in CELEBS.values() for name in names)
+_POOL_TEMPLATE_COUNTS = tuple(len(ITEM_TEMPLATES[role]) for role in _POOL_ROLES)
+_POOL_SIZE = len(_POOL_ROLES)
+
+# For athletes, prefer event templates sometimes: 25% of draws from this pool
+# land on an ATHLETE_EVENTS entry, the rest on a generic event, so a single
+# rng.choices() over it replaces a random() roll plus two picks.
+_ATHLETE_EVENT_POOL = (
+    tuple(e for e in ATHLETE_EVENTS for _ in VOCAB["event"])
+    + tuple(e for e in VOCAB["event"] for _ in range(3 * len(ATHLETE_EVENTS)))
+)
+
+# Everything a placeholder can be drawn from, keyed by pool name.
+_DRAW_POOLS: Dict[str, Sequence[str]] = {
+    **VOCAB,
+    "athlete_event": _ATHLETE_EVENT_POOL,
+    "esports_event": ESPORTS_EVENTS,
+}
+
 # --- Helpers ----------------------------------------------------------------
 
-def _pick_year(rng: random.Random) -> int:
+# Records are generated (and their random picks drawn) this many at a time.
+_GEN_CHUNK = 10_000
+
+# A parsed item template: literal segments interleaved with placeholder names.
+Template = Tuple[Tuple[str, ...], Tuple[str, ...]]
+# How one placeholder is filled: ("year", None), ("fixed", value) or
+# ("draw", name of a _DRAW_POOLS pool).
+FieldSource = Tuple[str, object]
+# A template resolved for one (role, celeb): literal segments plus field sources.
+ItemPlan = Tuple[Tuple[str, ...], Tuple[FieldSource, ...]]
+
+def _pick_years_batch(rng: random.Random, n: int, current_year: int = CURRENT_YEAR) -> List[int]:
     # Prefer modern memorabilia, lightly biased to recent years.
-    base = rng.randint(2004, datetime.now().year)
+    base = rng.choices(range(2004, current_year + 1), k=n)
     # small nudge towards later years
-    return max(base, rng.randint(2012, datetime.now().year))
-
-def _six_digit_unique(rng: random.Random, used: Set[str]) -> str:
-    # Generate a truly 6-digit numeric code (000000–999999 allowed? Spec says 6-digit serial; usually avoid leading 0s.)
-    # We'll enforce 6 digits, first digit 1–9 to avoid leading zero confusion.
-    while True:
-        s = f"{rng.randint(100000, 999999)}"
-        if s not in used:
-            used.add(s)
-            return s
-
-def _format_item(rng: random.Random, role: str, celeb: str, year: int) -> str:
-    tmpl = rng.choice(ITEM_TEMPLATES[role])
-    # Lightweight vocab pools
-    albums = ["1989", "Lemonade", "21", "After Hours", "Take Care", "Folklore", "Scorpion", "Starboy", "Sour", "UTOPIA"]
-    tours  = ["Eras", "Formation", "Monsters of Pop", "World Tour", "Summer Stadiums", "Neon Nights", "Happier Than Ever"]
-    events = ["Wimbledon Final", "NBA Finals", "Super Bowl", "World Cup Final", "US Open", "Champions League Final"]
-    films  = ["Oppenheimer", "Dune", "Barbie", "Titanic", "The Matrix", "Pulp Fiction", "Avengers: Endgame", "John Wick"]
-    props  = ["helmet", "shield", "gauntlet", "ring", "badge", "watch"]
-    venues = ["Madison Square Garden", "The Forum", "O2 Arena", "Comedy Cellar", "Laugh Factory"]
-    specials = ["Paper Tiger", "Tamborine", "Sticks & Stones", "Baby Cobra", "Homecoming"]
-    series = ["Challenge Series", "24 Hours", "Tech Reviews", "Creator Games", "Daily Vlog"]
-    platforms = ["YouTube", "Twitch", "TikTok", "Instagram"]
-    book_titles = ["The Long Night", "Ocean of Stars", "Electric Dreams", "Paper Hearts", "Hidden Doors"]
-    festivals = ["Coachella", "Ultra", "Tomorrowland", "EDC", "Lollapalooza"]
-    clubs = ["Ministry of Sound", "Fabric", "Pacha", "Berghain", "Output"]
-    orgs = ["T1", "G2 Esports", "Fnatic", "Team Liquid", "Cloud9"]
-    esports_events = ["Worlds", "IEM Katowice", "The International", "Valorant Masters", "ESL One"]
-    teams = ["Chicago Bulls", "Los Angeles Lakers", "New England Patriots", "Golden State Warriors", "New York Yankees"]
+    nudge = rng.choices(range(2012, current_year + 1), k=n)
+    return list(map(max, base, nudge))
+
+def _batch_serials(rng: random.Random, n: int, lo: int = SERIAL_MIN, hi: int = SERIAL_MAX) -> List[str]:
+    # Draw all serials in one call instead of rejecting collisions one at a time.
+    # First digit 1–9 (100000–999999) to avoid leading zero confusion.
+    return [f"{s:06d}" for s in rng.sample(range(lo, hi + 1), n)]
+
+def _draw_indices(rng: random.Random, count: int) -> tuple[List[int], List[int], List[int]]:
+    # Numeric phase: draw the integer columns (pool index, year, template index)
+    # for every record before any string formatting happens.
+    # Ensure we can generate arbitrary counts (with repeats of celebs allowed).
+    # A uniform index into the flattened pool picks each role in proportion to
+    # its celeb count; drawing it as floor(random() * n) directly skips the
+    # per-row population lookup inside rng.choices (same stream, same result).
+    rnd = rng.random
+    pool_idx = [floor(rnd() * _POOL_SIZE) for _ in repeat(None, count)]
+    years = _pick_years_batch(rng, count)
+    tmpl_idx = [floor(rnd() * _POOL_TEMPLATE_COUNTS[p]) for p in pool_idx]
+    return pool_idx, years, tmpl_idx
+
+def _compile_template(tmpl: str) -> Template:
+    # Split "{year} {team} jersey" into literals ("", " ", " jersey") and fields
+    # ("year", "team") once, so formatting is a plain join with no re-parsing.
+    parts: List[str] = [""]
+    fields: List[str] = []
+    for literal, field, spec, conversion in Formatter().parse(tmpl):
+        parts[-1] += literal
+        if field is not None:
+            if spec or conversion:
+                raise ValueError(f"Unsupported placeholder in item template: {tmpl!r}")
+            fields.append(field)
+            parts.append("")
+    return tuple(parts), tuple(fields)
+
+_ITEM_TEMPLATES_COMPILED: Dict[str, List[Template]] = {
+    role: [_compile_template(t) for t in templates] for role, templates in ITEM_TEMPLATES.items()
+}
 
-    # Role-aware fill-ins
-    mapping = {
-        "year": year,
-        "album": rng.choice(albums),
-        "tour": rng.choice(tours),
-        "event": rng.choice(events),
-        "film": rng.choice(films),
-        "prop": rng.choice(props),
-        "venue": rng.choice(venues),
-        "special": rng.choice(specials),
-        "series": rng.choice(series),
-        "platform": rng.choice(platforms),
-        "book": rng.choice(book_titles),
-        "festival": rng.choice(festivals),
-        "club": rng.choice(clubs),
-        "org": rng.choice(orgs),
-        "team": rng.choice(teams),
-        "sport": "sport",
-    }
+def _field_source(role: str, celeb: str, field: str) -> FieldSource:
+    if field == "year":
+        return ("year", None)
 
+    # Role-aware fill-ins
     if role == "Athlete":
-        sport, team = SPORT_BY_ATHLETE.get(celeb, ("sport", rng.choice(teams)))
-        mapping["sport"] = sport
-        mapping["team"] = team
-        # For athletes, prefer event templates sometimes
-        if rng.random() < 0.25:
-            mapping["event"] = rng.choice(["NBA Finals", "Super Bowl", "World Series", "Wimbledon Final", "US Open"])
-    elif role == "Esports Athlete":
-        mapping["event"] = rng.choice(esports_events)
-        mapping["org"] = rng.choice(orgs)
-
-    return tmpl.format(**mapping)
+        if (field == "sport" or field == "team") and celeb in SPORT_BY_ATHLETE:
+            sport, team = SPORT_BY_ATHLETE[celeb]
+            return ("fixed", sport if field == "sport" else team)
+        if field == "event":
+            return ("draw", "athlete_event")
+    elif role == "Esports Athlete" and field == "event":
+        return ("draw", "esports_event")
+
+    if field == "sport":
+        return ("fixed", "sport")
+    if field not in _DRAW_POOLS:
+        raise ValueError(f"Unknown placeholder {{{field}}} in {role} item templates")
+    return ("draw", field)
+
+# Per pool entry, its role's templates with every placeholder already resolved
+# to a fixed value or a pool, so a record only draws what its template uses.
+_POOL_PLANS: Tuple[List[ItemPlan], ...] = tuple(
+    [(parts, tuple(_field_source(role, celeb, f) for f in fields)) for parts, fields in _ITEM_TEMPLATES_COMPILED[role]]
+    for role, celeb in zip(_POOL_ROLES, _POOL_CELEBS)
+)
+
+def _format_item(plan: ItemPlan, year: int, draws: Dict[str, Iterator[str]]) -> str:
+    # `draws` yields pre-drawn values per pool, in record order (see _generate_chunk).
+    parts, sources = plan
+    if not sources:
+        return parts[0]
+    values = [
+        str(year) if kind == "year" else arg if kind == "fixed" else next(draws[arg])
+        for kind, arg in sources
+    ]
+    return "".join(chain.from_iterable(zip(parts, values))) + parts[-1]
 
 # --- Public API --------------------------------------------------------------
 
-def generate_dataset(count: int = 200, seed: int | None = None) -> List[AuthRecord]:
+def iter_dataset(
+    count: int = 200, seed: int | None = None, workers: int = 1, validate: bool = True
+) -> Iterator[Row]:
     """
-    Generate `count` unique AuthRecord rows with valid 6-digit serials.
+    Yield `count` unique records as tuples in FIELDS order.
+
+    Records are generated a chunk at a time and validated as they stream past,
+    so a writer consuming this never holds the whole dataset. With `workers` > 1
+    the records are generated in that many processes, each drawing from its own
+    disjoint slice of the serial space.
+
+    Serials are unique and 6 digits by construction, so validation is only a
+    safety net: pass `validate=False` to skip it. It is also skipped under
+    `python -O`.
     """
     if count < 1:
         raise ValueError("count must be >= 1")
+    if count > SERIAL_SPACE:
+        raise ValueError(f"count must be <= {SERIAL_SPACE} (size of the 6-digit serial space)")
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
     # Seed hierarchy: CLI arg > ENV > None
     if seed is None:
         env_seed = os.getenv("AUTHENTICON_SEED")
         seed = int(env_seed) if env_seed and env_seed.isdigit() else None
 
+    workers = min(workers, count)
+    if workers == 1:
+        rows = _iter_shard(count, seed, SERIAL_MIN, SERIAL_MAX)
+    else:
+        rows = _iter_sharded(count, seed, workers)
+    if __debug__ and validate:
+        rows = _validated(rows)
+    return rows
+
+def generate_columns(
+    count: int = 200, seed: int | None = None, workers: int = 1, validate: bool = True
+) -> Dict[str, list]:
+    """
+    Generate `count` unique records as parallel columns keyed by FIELDS.
+    """
+    columns = zip(*iter_dataset(count=count, seed=seed, workers=workers, validate=validate))
+    return {f: list(col) for f, col in zip(FIELDS, columns)}
+
+def generate_dataset(
+    count: int = 200, seed: int | None = None, workers: int = 1, validate: bool = True
+) -> List[AuthRecord]:
+    """
+    Generate `count` unique AuthRecord rows with valid 6-digit serials.
+    """
+    rows = iter_dataset(count=count, seed=seed, workers=workers, validate=validate)
+    return list(map(AuthRecord._make, rows))
+
+def _iter_sharded(count: int, seed: int | None, workers: int) -> Iterator[Row]:
+    # Split the records and the unused serial slack evenly, so every shard's
+    # serial range is at least as large as its record count.
+    slack = SERIAL_SPACE - count
+    counts = [count * (k + 1) // workers - count * k // workers for k in range(workers)]
+    sizes = [c + slack * (k + 1) // workers - slack * k // workers for k, c in enumerate(counts)]
+    los = [SERIAL_MIN + sum(sizes[:k]) for k in range(workers)]
+    his = [lo + size - 1 for lo, size in zip(los, sizes)]
+    seeds = [None if seed is None else seed + k for k in range(workers)]
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        for shard in ex.map(_generate_shard, counts, seeds, los, his):
+            yield from shard
+
+def _generate_shard(count: int, seed: int | None, lo: int, hi: int) -> List[Row]:
+    # Worker entry point: shards cross a process boundary, so materialize them.
+    return list(_iter_shard(count, seed, lo, hi))
+
+def _iter_shard(count: int, seed: int | None, lo: int, hi: int) -> Iterator[Row]:
+    # One independent slice of the dataset: its own RNG and serial range [lo, hi].
     rng = random.Random(seed)
-    used: Set[str] = set()
-    records: List[AuthRecord] = []
-
-    # Build a flattened (role, celeb) pool to draw from
-    role_celeb_pool: List[tuple[str, str]] = []
-    for role, names in CELEBS.items():
-        for name in names:
-            role_celeb_pool.append((role, name))
-
-    # Ensure we can generate arbitrary counts (with repeats of celebs allowed)
-    for _ in range(count):
-        role, celeb = rng.choice(role_celeb_pool)
-        year = _pick_year(rng)
-        item = _format_item(rng, role, celeb, year)
-        serial = _six_digit_unique(rng, used)
-        rec = AuthRecord(
-            serial_number=serial,
-            role=role,
-            celebrity=celeb,
-            item_description=item,
-            year=year,
-            source="seed-generator v1",
-        )
-        records.append(rec)
-
-    _validate(records)
-    return records
-
-def _validate(records: Iterable[AuthRecord]) -> None:
-    seen: Set[str] = set()
-    for r in records:
-        if not SERIAL_RE.match(r.serial_number):
-            raise ValueError(f"Invalid serial format: {r.serial_number}")
-        if r.serial_number in seen:
-            raise ValueError(f"Duplicate serial: {r.serial_number}")
-        seen.add(r.serial_number)
+    serials = _batch_serials(rng, count, lo, hi)
+    for start in range(0, count, _GEN_CHUNK):
+        yield from _generate_chunk(rng, serials[start:start + _GEN_CHUNK])
+
+def _generate_chunk(rng: random.Random, serials: List[str]) -> Iterator[Row]:
+    count = len(serials)
+
+    pool_idx, years, tmpl_idx = _draw_indices(rng, count)
+    plans = [_POOL_PLANS[p][t] for p, t in zip(pool_idx, tmpl_idx)]
+
+    # Draw only the placeholder values the chosen templates need, one batch
+    # per pool, so the per-record loop below never touches the RNG.
+    needed = Counter(arg for _, sources in plans for kind, arg in sources if kind == "draw")
+    draws = {name: iter(rng.choices(_DRAW_POOLS[name], k=n)) for name, n in needed.items()}
+
+    for i in range(count):
+        p = pool_idx[i]
+        year = years[i]
+        item = _format_item(plans[i], year, draws)
+        yield (serials[i], _POOL_ROLES[p], _POOL_CELEBS[p], item, year, _SOURCE)
+
+def _validated(rows: Iterable[Row]) -> Iterator[Row]:
+    # Check each serial as it streams past instead of a second pass.
+    # One byte per possible 6-digit serial instead of a set of strings.
+    seen = bytearray(10 ** 6)
+    for row in rows:
+        s = row[0]
+        # Same test as SERIAL_RE (\d is Unicode Nd, i.e. str.isdecimal) without regex dispatch.
+        if not (len(s) == 6 and s.isdecimal()):
+            raise ValueError(f"Invalid serial format: {s}")
+        n = int(s)
+        if seen[n]:
+            raise ValueError(f"Duplicate serial: {s}")
+        seen[n] = 1
+        yield row
 
 # --- Serialization -----------------------------------------------------------
 
-def write_json(records: List[AuthRecord], path: str) -> None:
+_CSV_CHUNK = 10_000         # rows formatted and handed to os.write at a time
+
+# Writers accept AuthRecord objects or the plain tuples from iter_dataset();
+# both are tuples in FIELDS order.
+
+def write_json(records: Iterable[Row], path: str) -> None:
+    # Encode in one shot and issue a single write; json.dump streams many small chunks.
+    payload = json.dumps(
+        [
+            {
+                "serial_number": s, "role": role, "celebrity": celeb,
+                "item_description": item, "year": year, "source": source,
+            }
+            for s, role, celeb, item, year, source in records
+        ],
+        ensure_ascii=False,
+        indent=2,
+    )
     with open(path, "w", encoding="utf-8") as f:
-        json.dump([asdict(r) for r in records], f, ensure_ascii=False, indent=2)
-
-def write_csv(records: List[AuthRecord], path: str) -> None:
-    fields = ["serial_number", "role", "celebrity", "item_description", "year", "source"]
-    with open(path, "w", encoding="utf-8", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=fields)
-        w.writeheader()
-        for r in records:
-            w.writerow(asdict(r))
+        f.write(payload)
+
+def write_csv(records: Iterable[Row], path: str) -> None:
+    # Every row has the same six-column shape, so a chunk is formatted with a
+    # single f-string per row and no per-field escaping. The whole chunk is then
+    # checked at once; only a chunk containing a field that csv.writer would
+    # quote is re-encoded through csv.writer, so output is identical.
+    rows = iter(records)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        _write_all(fd, (",".join(FIELDS) + "\r\n").encode())
+        while chunk := list(islice(rows, _CSV_CHUNK)):
+            text = "".join([
+                f"{s},{role},{celeb},{item},{year},{source}\r\n"
+                for s, role, celeb, item, year, source in chunk
+            ])
+            if not _csv_plain(text, len(chunk)):
+                text = _csv_quoted(chunk)
+            _write_all(fd, text.encode())
+    finally:
+        os.close(fd)
+
+def _csv_plain(text: str, n: int) -> bool:
+    # Each unquoted row adds exactly 5 commas, one CR and one LF, and no quotes;
+    # any extra one means some field needs csv.writer's quoting.
+    return (
+        text.count(",") == 5 * n
+        and text.count("\n") == n
+        and text.count("\r") == n
+        and '"' not in text
+    )
+
+def _csv_quoted(rows: List[Row]) -> str:
+    out = io.StringIO()
+    csv.writer(out).writerows(rows)
+    return out.getvalue()
+
+def _write_all(fd: int, data: bytes) -> None:
+    # os.write may write fewer bytes than asked; loop until everything is out.
+    with memoryview(data) as view:
+        written = 0
+        while written < len(view):
+            written += os.write(fd, view[written:])
+
+def write_parquet(records: Iterable[Row], path: str) -> None:
+    # Optional dependency: only needed for --format parquet.
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet output requires pyarrow (pip install pyarrow)") from e
+    columns = zip(*records)
+    table = pa.table({f: list(col) for f, col in zip(FIELDS, columns)})
+    # role/source/celebrity repeat heavily, so dictionary-encode them.
+    pq.write_table(table, path, compression="zstd", use_dictionary=["role", "source", "celebrity"])
 
 # --- CLI --------------------------------------------------------------------
 
@@ -385,18 +598,24 @@ def _parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Generate autograph authenticon seed data.")
     p.add_argument("--count", type=int, default=200, help="Number of records to generate (default: 200)")
     p.add_argument("--out", type=str, default="authenticon_seed.json", help="Output file path")
-    p.add_argument("--format", choices=["json", "csv"], default="json", help="Output format")
+    p.add_argument("--format", choices=["json", "csv", "parquet"], default="json", help="Output format")
     p.add_argument("--seed", type=int, default=None, help="Deterministic RNG seed (overrides AUTHENTICON_SEED)")
+    p.add_argument("--workers", type=int, default=1, help="Processes to generate with (default: 1)")
+    p.add_argument("--skip-validate", action="store_true", help="Skip the serial format/uniqueness check")
     return p.parse_args()
 
 def main() -> None:
     args = _parse_args()
-    records = generate_dataset(count=args.count, seed=args.seed)
+    rows = iter_dataset(
+        count=args.count, seed=args.seed, workers=args.workers, validate=not args.skip_validate
+    )
     if args.format == "json":
-        write_json(records, args.out)
+        write_json(rows, args.out)
+    elif args.format == "parquet":
+        write_parquet(rows, args.out)
     else:
-        write_csv(records, args.out)
-    print(f"Wrote {len(records)} records to {args.out} ({args.format}).")
+        write_csv(rows, args.out)
+    print(f"Wrote {args.count} records to {args.out} ({args.format}).")
 
 if __name__ == "__main__":
     main()